@@ -1,26 +1,173 @@
 """see class tattleRequestHandler"""
 
+import argparse
 import datetime
+import email.utils
+import fcntl
+import json
+import mimetypes
 import os
+import signal
+import socket
 import sqlite3
 import subprocess
 import threading
 import time
 import traceback
+from collections import Counter, deque
 from datetime import timedelta
 from http.server import BaseHTTPRequestHandler, HTTPServer
 from pathlib import Path
 from socketserver import ThreadingMixIn
-from urllib.parse import parse_qs, unquote
-from xml.sax.saxutils import quoteattr
+from urllib.parse import parse_qs, unquote, urlencode
+from xml.sax.saxutils import escape, quoteattr
+
+
+class JobRunner:
+    """Run background shell commands single-flight.
+
+    Requesting a job that's already running joins that run instead of starting
+    another.  At most `max_running` jobs run at once, and a job isn't re-run
+    within `cooldown` seconds of its last run finishing.  The last `log_lines`
+    lines of output are kept, with start time, duration, and exit status.
+
+    If `state_dir` is set, job status is shared through files there and a lock
+    file keeps jobs single-flight across processes (see run(workers=N)).
+    `max_running` is still per process.
+    """
+
+    def __init__(
+        self, commands, max_running=1, cooldown=60, log_lines=200, state_dir=None
+    ):
+        self.commands = commands  # job name -> shell command
+        self.max_running = max_running
+        self.cooldown = cooldown
+        self.log_lines = log_lines
+        self.state_dir = state_dir
+        self.lock = threading.Lock()
+        self.jobs = {}  # job name -> status dict, see start()
+
+    def running(self):
+        return [name for name, job in self.jobs.items() if job["state"] == "running"]
+
+    def start(self, name):
+        """Start job `name` if possible, return a message saying what happened"""
+        with self.lock:
+            job = self.jobs.get(name)
+            if job and job["state"] == "running":
+                return "already running, started %s" % job["started"].strftime("%X")
+            lock_file = None
+            if self.state_dir:
+                lock_file = (self.state_dir / f".tattle_job_{name}.lock").open("w")
+                try:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    lock_file.close()
+                    return "already running in another worker"
+                # we hold the lock, so a "running" state is from a dead process
+                job = self._load(name) or job
+            if job and job["finished"]:
+                wait = self.cooldown - (time.time() - job["finished"].timestamp())
+                if wait > 0:
+                    if lock_file:
+                        lock_file.close()
+                    return "ran recently, cooling down for %.0fs" % wait
+            running = self.running()
+            if len(running) >= self.max_running:
+                if lock_file:
+                    lock_file.close()
+                return "busy, %s running" % ", ".join(running)
+            job = self.jobs[name] = {
+                "name": name,
+                "state": "running",
+                "command": self.commands[name],
+                "started": datetime.datetime.now(),
+                "finished": None,
+                "duration": None,
+                "returncode": None,
+                "log": deque(maxlen=self.log_lines),
+            }
+            self._save(job)
+        threading.Thread(target=self._run, args=(job, lock_file), daemon=True).start()
+        return "started"
+
+    def _run(self, job, lock_file):
+        try:
+            proc = subprocess.Popen(
+                job["command"],
+                shell=True,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                errors="replace",
+            )
+            saved = time.time()
+            for line in proc.stdout:
+                job["log"].append(line.rstrip("\n"))
+                if time.time() - saved > 1:  # share progress, but not every line
+                    self._save(job)
+                    saved = time.time()
+            returncode = proc.wait()
+        except Exception:
+            job["log"].append(traceback.format_exc())
+            returncode = None
+        with self.lock:
+            job["finished"] = datetime.datetime.now()
+            job["duration"] = job["finished"] - job["started"]
+            job["returncode"] = returncode
+            job["state"] = "done" if returncode == 0 else "failed"
+            self._save(job)
+        if lock_file:
+            lock_file.close()  # releases flock
+
+    def _save(self, job):
+        """Write job status to state_dir, if set, for other processes"""
+        if not self.state_dir:
+            return
+        state = dict(
+            job,
+            started=job["started"].isoformat(),
+            finished=job["finished"] and job["finished"].isoformat(),
+            duration=job["duration"] and job["duration"].total_seconds(),
+            log=list(job["log"]),
+        )
+        path = self.state_dir / f".tattle_job_{job['name']}.json"
+        tmp = path.with_name(f"{path.name}.{os.getpid()}")
+        tmp.write_text(json.dumps(state))
+        tmp.replace(path)
+
+    def _load(self, name):
+        """Job status saved by any process, None if there isn't any"""
+        path = self.state_dir / f".tattle_job_{name}.json"
+        try:
+            state = json.loads(path.read_text())
+        except FileNotFoundError:
+            return None
+        for key in "started", "finished":
+            if state[key]:
+                state[key] = datetime.datetime.fromisoformat(state[key])
+        if state["duration"] is not None:
+            state["duration"] = timedelta(seconds=state["duration"])
+        return state
+
+    def status(self, name):
+        """Status dict for job `name`, None if it's never been run"""
+        with self.lock:
+            job = self.jobs.get(name)
+            if self.state_dir and not (job and job["state"] == "running"):
+                return self._load(name)
+            return dict(job, log=list(job["log"])) if job else None
 
 
 class tattleRequestHandler(BaseHTTPRequestHandler):
     """
     tattle.py, dependency free simple status monitoring system.
 
-    /
-      show status of all processes
+    /[?q=text&problems=1&group=<depth>&open=<group>&page=<n>]
+      show status of all processes, optionally only those matching text, only
+      those with problems, grouped by the first <depth> parts of their tag,
+      paginated
     /quit/
       kill the server
     /init/
@@ -29,6 +176,12 @@ class tattleRequestHandler(BaseHTTPRequestHandler):
       self test (same as init)
     /archive/
       archive all but last 100 logs for each process, vacuum DB
+    /update/
+      run tattle_update in the background, unless it's running or just ran
+    /update/status
+      show status and output of the last tattle_update run
+    /report/[<name>]
+      list reports, or serve report <name>
     /register/<process>/<seconds>/description text
       register a process with tag <process> which should report ever <seconds> seconds
       repeating ok, just changes interval and description
@@ -42,7 +195,7 @@ class tattleRequestHandler(BaseHTTPRequestHandler):
         "OK": 0,
         "FAIL": 1,
         "DISABLE": 0,
-        "ENABLEL": 0,
+        "ENABLE": 0,
         "DEFER": 0,
         "DEFUNCT": 0,
         "HARD": 2,
@@ -57,6 +210,11 @@ class tattleRequestHandler(BaseHTTPRequestHandler):
         path = unquote(self.path.strip("/ "))
         self.args = path.split("/")
 
+        if self.args[0] == "report" and len(self.args) > 1:
+            # sets its own headers, may be 304 / 206 / 404
+            self.send_report(self.args[1])
+            return
+
         dispatch = {
             "": self.show_status,
             "all": self.show_all,
@@ -78,7 +236,10 @@ class tattleRequestHandler(BaseHTTPRequestHandler):
             self.send_response(200)
             self.send_header("Content-type", "text/html")
             if "Host" in self.headers:
-                self.send_header("Refresh", "70; url=//%s" % self.headers["Host"])
+                url = "//%s" % self.headers["Host"]
+                if self.args[0] == "" and self.query:
+                    url += "/?" + self.query  # keep dashboard view
+                self.send_header("Refresh", "70; url=%s" % url)
             self.end_headers()
 
         # self.out does nothing when self.args[0] == 'log'
@@ -120,7 +281,7 @@ class tattleRequestHandler(BaseHTTPRequestHandler):
         self.out(self.entry("DB file %s..." % self.dbfile))
         self.out(self.entry("...exists: %s" % os.path.isfile(self.dbfile)))
         self.out(self.entry("Got connection ok..."))
-        con = sqlite3.connect(self.dbfile)
+        con = self.connect()
         self.out(self.entry(bool(con)))
         cur = con.cursor()
         for proc in [i[0] for i in cur.execute("SELECT process FROM process")]:
@@ -156,7 +317,7 @@ class tattleRequestHandler(BaseHTTPRequestHandler):
         logs.append(self.entry("DB file %s..." % self.dbfile))
         logs.append(self.entry("...exists: %s" % os.path.isfile(self.dbfile)))
         logs.append(self.entry("Got connection ok..."))
-        con = sqlite3.connect(self.dbfile)
+        con = self.connect()
         logs.append(self.entry(bool(con)))
         cur = con.cursor()
         cur.execute("""SELECT name FROM sqlite_master WHERE type='table'""")
@@ -239,11 +400,12 @@ class tattleRequestHandler(BaseHTTPRequestHandler):
                 message = "*no msg.*"
 
         self.out(self.entry("'%s' says %s:%s" % (tag, status, message)))
-        self.show_status()
+        if self.query:  # no output otherwise, don't build status for nothing
+            self.show_status()
 
         timestamp = datetime.datetime.now()
 
-        con = sqlite3.connect(self.dbfile)
+        con = self.connect()
         cur = con.cursor()
         table = "defer" if status == "DEFER" else "log"
         cur.execute(
@@ -260,8 +422,14 @@ class tattleRequestHandler(BaseHTTPRequestHandler):
     def quit(self):
         self.out(self.entry("TERMINATING"))
 
+        def stop():
+            if self.server.supervisor:  # stop all workers, not just this one
+                os.kill(self.server.supervisor, signal.SIGTERM)
+            else:
+                self.server.shutdown()
+
         # wait 1.0 seconds for the request to finish before ending
-        threading.Timer(1.0, lambda: self.server.shutdown()).start()
+        threading.Timer(1.0, stop).start()
 
     _hms = {"d": 3600 * 24, "h": 3600, "m": 60, "s": 1}
 
@@ -300,7 +468,7 @@ class tattleRequestHandler(BaseHTTPRequestHandler):
             )
         )
 
-        con = sqlite3.connect(self.dbfile)
+        con = self.connect()
         cur = con.cursor()
 
         cur.execute("select * from process where process=?", [tag])
@@ -319,17 +487,18 @@ class tattleRequestHandler(BaseHTTPRequestHandler):
             )
         con.commit()
 
-    def setup(self):
-        super().setup()
+    dbfile = "tattle.sqlite"
 
-        self.dbfile = "tattle.sqlite"
+    def connect(self):
+        # wait for other writers, which may be in other worker processes
+        return sqlite3.connect(self.dbfile, timeout=30)
 
     def show(self):
         args = self.args[:]
         args.pop(0)  # discard command name
         tag = args.pop(0)
 
-        con = sqlite3.connect(self.dbfile)
+        con = self.connect()
         cur = con.cursor()
         cur.execute(
             """select description, interval from process where process=?""", [tag]
@@ -455,13 +624,15 @@ class tattleRequestHandler(BaseHTTPRequestHandler):
                 )
                 con.commit()
 
-    def get_status(self, show_all=False):
-        con = sqlite3.connect(self.dbfile)
+    def get_status(self, show_all=False, search=None):
+        """Yield status of each process, optionally only those with `search` in
+        their tag, description, or last message"""
+        con = self.connect()
         cur = con.cursor()
 
         self.delete_defers(con, cur)
         cur.execute("select distinct process from defer")
-        defered = [i[0] for i in cur]
+        defered = {i[0] for i in cur}
 
         # (?, ?, ?) for statuses
         in_clause = "(" + ",".join("?" * len(self.statuses)) + ")"
@@ -472,11 +643,26 @@ class tattleRequestHandler(BaseHTTPRequestHandler):
             self.statuses,
         )
 
+        if search:
+            like = "%" + search.replace("\\", "\\\\").replace("%", "\\%")
+            like = like.replace("_", "\\_") + "%"
+            match = "like ? escape '\\'"
+            search_new = f"and (process {match} or description {match})"
+            search_log = (
+                f"and (last_msg.process {match} or description {match} "
+                f"or message {match})"
+            )
+            search_params = [like] * 5
+        else:
+            search_new = search_log = ""
+            search_params = []
+
         cur.execute(
-            """
+            f"""
             select process, 0, 'NEW', process.*, 'NEW', 'NEW' from
             process left join log using (process) where log.process is null
               and (description is null or description not like 'DEFUNCT:%')
+              {search_new}
 
             union
 
@@ -486,9 +672,11 @@ class tattleRequestHandler(BaseHTTPRequestHandler):
             left join process on (last_msg.process = process.process)
 
             where (description is null or description not like 'DEFUNCT:%')
+              {search_log}
 
             order by last
-            """
+            """,
+            search_params,
         )
 
         for (
@@ -564,12 +752,15 @@ class tattleRequestHandler(BaseHTTPRequestHandler):
                 ip,
             )
 
+            tag = log_process
             log_process = "<a title=%s href=%s>%s</a> " % (
                 quoteattr(description),
                 quoteattr("show/" + log_process),
                 log_process,
             )
             yield {
+                "process": tag,
+                "level": self.status_level.get(out_status, 0),
                 "part": dict(
                     log_process=log_process,
                     details=details,
@@ -580,15 +771,115 @@ class tattleRequestHandler(BaseHTTPRequestHandler):
                 )
             }
 
+    group_sep = "."
+    page_size = 200
+
+    def view_params(self):
+        """Dashboard view options from the query string, see class docs."""
+        dat = parse_qs(self.query or "")
+        params = {i: dat.get(i, [""])[0] for i in ("q", "problems", "group", "open")}
+        for key in "group", "page":
+            try:
+                params[key] = max(0, int(dat.get(key, [0])[0]))
+            except ValueError:
+                params[key] = 0
+        return params
+
+    def view_url(self, params, **changes):
+        """URL for the current view with `changes` applied"""
+        params = dict(params, **changes)
+        return "?" + urlencode({k: v for k, v in params.items() if v})
+
+    def paginate(self, items, params, what="processes"):
+        """Return (items on current page, pager HTML)"""
+        pages = max(1, -(-len(items) // self.page_size))
+        page = min(max(1, params["page"]), pages)
+        if pages == 1:
+            pager = ""
+        else:
+            links = [
+                "<a href=%s>%s</a>" % (quoteattr(self.view_url(params, page=i)), text)
+                for i, text in ((page - 1, "&laquo; prev"), (page + 1, "next &raquo;"))
+                if 1 <= i <= pages
+            ]
+            pager = "<div class='grp'>page %d of %d (%d %s) %s</div>" % (
+                page,
+                pages,
+                len(items),
+                what,
+                " ".join(links),
+            )
+        start = (page - 1) * self.page_size
+        return items[start : start + self.page_size], pager
+
     def show_status(self, show_all=False):
-        for status in self.get_status(show_all=show_all):
+        params = self.view_params()
+        self.out(
+            self.template["filter"].format(
+                action="all" if show_all else "",
+                q=quoteattr(params["q"]),
+                problems="checked" if params["problems"] else "",
+                group=quoteattr(str(params["group"] or "")),
+                sep=escape(self.group_sep),
+            )
+        )
+        rows = self.get_status(show_all=show_all, search=params["q"])
+        if params["problems"]:
+            rows = (i for i in rows if i["level"])
+        if params["group"]:
+            self.show_groups(list(rows), params)
+            return
+
+        rows, pager = self.paginate(list(rows), params)
+        self.out(pager)
+        for status in rows:
+            self.out(self.status_html(status))
+        self.out(pager)
+
+    def show_groups(self, rows, params):
+        """Show one summary line per group of processes, followed by the
+        group's problem processes, or all its processes if it's open."""
+        groups = {}
+        for status in rows:
+            parts = status["process"].split(self.group_sep)
+            group = self.group_sep.join(parts[: params["group"]])
+            groups.setdefault(group, []).append(status)
+
+        names, pager = self.paginate(sorted(groups), params, what="groups")
+        self.out(pager)
+        for name in names:
+            members = groups[name]
+            is_open = name == params["open"]
+            worst = max(members, key=lambda i: i["level"])["part"]["out_status"]
+            counts = Counter(i["part"]["out_status"] for i in members)
+            counts = sorted(
+                counts.items(), key=lambda i: (-self.status_level.get(i[0], 0), i[0])
+            )
             self.out(
-                "<div class='ent'>"
-                "<span class='tag'>{log_process} <span title='{details}' "
-                "class='ts {out_status}'>{timestamp} </span> </span>"
-                " <span class='msg'> {message} <span class='time'>{spare}</span></span>"
-                "</div>".format_map(status["part"])
+                "<div class='grp'><a href=%s><span class='ts %s'>%s</span> %s</a>"
+                " <span class='time'>%d processes: %s</span></div>"
+                % (
+                    quoteattr(self.view_url(params, open="" if is_open else name)),
+                    worst,
+                    "&#9662;" if is_open else "&#9656;",
+                    escape(name),
+                    len(members),
+                    ", ".join("%d %s" % (n, status) for status, n in counts),
+                )
             )
+            for status in members:
+                if is_open or status["level"]:
+                    self.out(self.status_html(status))
+        self.out(pager)
+
+    def status_html(self, status):
+        return (
+            "<div class='ent'>"
+            "<span class='tag'>{log_process} <span title='{details}' "
+            "class='ts {out_status}'>{timestamp} </span> </span>"
+            " <span class='msg'> {message} <span class='time'>{spare}</span></span>"
+            "</div>".format_map(status["part"])
+        )
 
     schema = {
         "process": [
@@ -608,31 +899,191 @@ class tattleRequestHandler(BaseHTTPRequestHandler):
     schema["old_data"] = schema["log"]
     schema["defer"] = schema["log"]
 
+    jobs = JobRunner({"update": "tattle_update"})
+
     def update(self):
-        """Make a system call to run `tattle_update` in the background.
+        """Run `tattle_update` in the background, or show its status.
 
-        tattle_update needs to be executable and on the path.
+        /update/ starts a run unless one is already running or just finished,
+        /update/status only shows status.  tattle_update needs to be executable
+        and on the path.
         """
-        subprocess.Popen(
-            "tattle_update &",
-            shell=True,
-            stderr=subprocess.DEVNULL,
-            stdout=subprocess.DEVNULL,
+        if self.args[1:2] != ["status"]:
+            msg = self.jobs.start("update")
+            self.out("<p><code>tattle_update</code>: %s</p>" % escape(msg))
+        self.update_status()
+
+    def update_status(self):
+        job = self.jobs.status("update")
+        if not job:
+            self.out("<p><code>tattle_update</code> has not been run.</p>")
+            return
+        if job["state"] == "running":
+            self.out('<meta http-equiv="refresh" content="5; url=/update/status">')
+            elapsed = datetime.datetime.now() - job["started"]
+            ended = "running for %s" % str(elapsed).split(".")[0]
+        else:
+            ended = "%s after %s, exit status %s" % (
+                job["state"],
+                str(job["duration"]).split(".")[0],
+                job["returncode"],
+            )
+        self.out(
+            self.entry(
+                "<code>%s</code> started" % escape(job["command"]),
+                class_="FAIL" if job["state"] == "failed" else "OK",
+                ts=job["started"],
+            )
         )
-        self.out("<p><code>tattle_update</code> called.</p>")
+        self.out(self.entry(ended))
+        self.out("<pre>%s</pre>" % escape("\n".join(job["log"])))
+
+    reports_dir = Path("reports")
+    _report_listing = {"mtime": None, "names": []}
+
+    def report_names(self):
+        """Names of reports, cached until the reports dir. mtime changes"""
+        cache = self._report_listing
+        try:
+            mtime = self.reports_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            return []
+        if cache["mtime"] != mtime:
+            names = {i.name for i in self.reports_dir.iterdir() if i.is_file()}
+            # don't list precompressed copies of files that exist uncompressed
+            names = sorted(
+                i
+                for i in names
+                if not i.startswith(".")
+                and not (i.endswith(".gz") and i[:-3] in names)
+            )
+            cache.update(mtime=mtime, names=names)
+        return cache["names"]
 
     def reports(self):
         """Show / serve reports"""
-        if len(self.args) > 1:
-            self.out((Path("reports") / self.args[1]).read_text())
-        else:
-            self.out(self.template["hdr"])
-            for path in Path("reports").glob("*"):
-                self.out(
-                    "<div><a target='blank' "
-                    f"href='/report/{path.name}'>{path.name}</a></div>"
-                )
-            self.out(self.template["ftr"].format(time=time.asctime()))
+        self.out(self.template["hdr"])
+        for name in self.report_names():
+            self.out(f"<div><a target='blank' href='/report/{name}'>{name}</a></div>")
+        self.out(self.template["ftr"].format(time=time.asctime()))
+
+    def send_report(self, name):
+        """Serve a report file with caching headers and Range support.
+
+        A precompressed `name.gz` is served instead when the client accepts gzip
+        and it's not older than `name`.  The body is sent with socket.sendfile().
+        """
+        path = self.reports_dir / name
+        if name.startswith(".") or not path.is_file():
+            self.send_error(404)
+            return
+        content_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+        if content_type.startswith("text/"):
+            content_type += "; charset=utf-8"
+
+        encoding = None
+        gz = path.with_name(name + ".gz")
+        if (
+            not name.endswith(".gz")
+            and "gzip" in self.headers.get("Accept-Encoding", "")
+            and gz.is_file()
+            and gz.stat().st_mtime >= path.stat().st_mtime
+        ):
+            path, encoding = gz, "gzip"
+
+        stat = path.stat()
+        size = stat.st_size
+        etag = '"%x-%x%s"' % (stat.st_mtime_ns, size, "-gz" if encoding else "")
+        last_modified = email.utils.formatdate(stat.st_mtime, usegmt=True)
+
+        def common_headers():
+            self.send_header("ETag", etag)
+            self.send_header("Last-Modified", last_modified)
+            self.send_header("Cache-Control", "no-cache")  # always revalidate
+            self.send_header("Vary", "Accept-Encoding")
+            self.send_header("Accept-Ranges", "bytes")
+
+        if self.not_modified(etag, stat.st_mtime):
+            self.send_response(304)
+            common_headers()
+            self.end_headers()
+            return
+
+        start, end = 0, size - 1
+        status = 200
+        range_ = self.headers.get("Range")
+        if_range = self.headers.get("If-Range")
+        if range_ and (not if_range or if_range in (etag, last_modified)):
+            byte_range = self.parse_range(range_, size)
+            if byte_range is False:
+                self.send_response(416)
+                self.send_header("Content-Range", "bytes */%d" % size)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            if byte_range:
+                (start, end), status = byte_range, 206
+
+        count = end - start + 1
+        self.send_response(status)
+        self.send_header("Content-type", content_type)
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        common_headers()
+        if status == 206:
+            self.send_header("Content-Range", "bytes %d-%d/%d" % (start, end, size))
+        self.send_header("Content-Length", str(count))
+        self.end_headers()
+
+        if count > 0:
+            with path.open("rb") as file_:
+                self.wfile.flush()
+                self.connection.sendfile(file_, start, count)
+
+    def not_modified(self, etag, mtime):
+        """True if the If-None-Match / If-Modified-Since headers match"""
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match:
+            tags = [i.strip().removeprefix("W/") for i in if_none_match.split(",")]
+            return "*" in tags or etag in tags
+        if_modified_since = self.headers.get("If-Modified-Since")
+        if if_modified_since:
+            try:
+                since = email.utils.parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError):
+                return False
+            return int(mtime) <= since.timestamp()
+        return False
+
+    @staticmethod
+    def parse_range(range_, size):
+        """Parse a single `bytes=` range header.
+
+        Returns (start, end) inclusive, None to ignore the header (multiple or
+        malformed ranges, serve whole file), or False if unsatisfiable.
+        """
+        unit, _, spec = range_.partition("=")
+        if unit.strip() != "bytes" or "," in spec:
+            return None
+        first, sep, last = spec.strip().partition("-")
+        if not sep:
+            return None
+        try:
+            if first:
+                start = int(first)
+                end = int(last) if last else size - 1
+            else:  # suffix range, last N bytes
+                if not last:
+                    return None
+                start, end = max(0, size - int(last)), size - 1
+        except ValueError:
+            return None
+        if start > end and first and last:
+            return None  # syntactically invalid, ignore
+        end = min(end, size - 1)
+        if start >= size or start > end:
+            return False
+        return start, end
 
     def favicon(self):
         """Based on current status"""
@@ -689,6 +1140,7 @@ class tattleRequestHandler(BaseHTTPRequestHandler):
             a:hover {{ text-decoration: underline; color: red }}
             .right {{ text-align: right }}
             .time {{ clear: left; }}
+            .grp {{ clear: left; padding-top: 0.3em; }}
             hr {{ border-style: solid; border-color: grey; border-width: 2px 0 0 0 ; }}
             </style>
             <title>Tattle</title>
@@ -697,11 +1149,20 @@ class tattleRequestHandler(BaseHTTPRequestHandler):
             <a href="/all">Show disabled</a>
             <a href="/quit">Re-start</a>
             <a href="/update">Get updates</a>
+            <a href="/update/status">Update status</a>
             <a href="/report">Reports</a>
             </div><hr/>""".format(
             **colors
         ),
         "ftr": """<div class='time'>{time}</div></body></html>""",
+        "filter": """<form method="get" action="/{action}"><div>
+            <input name="q" value={q} placeholder="search"/>
+            <label><input type="checkbox" name="problems" value="1" {problems}/>
+              problems only</label>
+            <label>group by <input name="group" value={group} size="2"/>
+              '{sep}' separated parts of tag</label>
+            <input type="submit" value="show"/>
+            </div></form>""",
         "help": """<pre>HELP</pre>
             <pre>{path}</pre>""",
         "manual": """<form method="get" action="/{action}">
@@ -713,15 +1174,96 @@ class tattleRequestHandler(BaseHTTPRequestHandler):
 
 
 class ThreadedServer(ThreadingMixIn, HTTPServer):
-    pass
+    reuse_port = False  # set SO_REUSEPORT so several processes can bind
+    supervisor = None  # pid of supervisor process, when run with workers
+
+    def server_bind(self):
+        if self.reuse_port:
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
 
 
-def run(server_class=ThreadedServer, handler_class=tattleRequestHandler):
+def serve(server_class, handler_class, supervisor=None):
+    """Serve requests until shutdown() or SIGTERM"""
     server_address = ("0.0.0.0", 8111)
     httpd = server_class(server_address, handler_class)
+    httpd.supervisor = supervisor
 
+    # shutdown() waits for serve_forever() to stop, so can't be called
+    # from the (main thread) signal handler directly
+    signal.signal(
+        signal.SIGTERM, lambda *args: threading.Thread(target=httpd.shutdown).start()
+    )
     httpd.serve_forever()
+    httpd.server_close()
+
+
+def run(server_class=ThreadedServer, handler_class=tattleRequestHandler, workers=1):
+    """Run server.  With `workers` > 1, fork that many worker processes sharing
+    the port through SO_REUSEPORT, and restart any that die.  SIGTERM / SIGINT
+    to the supervisor, or /quit/ in any worker, stops all of them."""
+    if workers <= 1:
+        serve(server_class, handler_class)
+        return
+
+    server_class = type(server_class.__name__, (server_class,), {"reuse_port": True})
+    # WAL lets readers in one worker proceed while another writes
+    con = sqlite3.connect(handler_class.dbfile, timeout=30)
+    con.execute("pragma journal_mode=wal")
+    con.close()
+    handler_class.jobs.state_dir = Path(".")
+
+    supervisor = os.getpid()
+    children = {}  # pid -> start time
+    stopping = False
+
+    def spawn():
+        pid = os.fork()
+        if pid == 0:
+            code = 1
+            try:
+                signal.signal(signal.SIGINT, signal.SIG_IGN)  # supervisor handles it
+                serve(server_class, handler_class, supervisor=supervisor)
+                code = 0
+            except Exception:
+                traceback.print_exc()
+            finally:
+                os._exit(code)
+        children[pid] = time.time()
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    for i in range(workers):
+        spawn()
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        started = children.pop(pid, None)
+        if started is None or stopping:
+            continue
+        print(f"worker {pid} exited with status {status}, restarting")
+        if time.time() - started < 1:
+            time.sleep(1)  # don't spin if workers die on startup
+        spawn()
 
 
 if __name__ == "__main__":
-    run()
+    parser = argparse.ArgumentParser(description="tattle status monitor")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.environ.get("TATTLE_WORKERS", 1)),
+        help="worker processes to fork, default $TATTLE_WORKERS or 1",
+    )
+    run(workers=parser.parse_args().workers)